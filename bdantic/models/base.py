@@ -14,22 +14,37 @@ make them behave as lists/dictionaries.
 from __future__ import annotations
 
 import datetime
+import functools
 import hashlib
 import os
+import sys
 from datetime import date
 from decimal import Decimal
-from typing import Any, Callable, Dict, Generic, List, Optional, Type, TypeVar
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    List,
+    NamedTuple,
+    Optional,
+    Type,
+    TypeVar,
+)
 
 import jmespath  # type: ignore
 import orjson
 from beancount.core import data, number
 from beancount.parser import printer  # type: ignore
-from pydantic import BaseModel, Extra, Field
+from pydantic import VERSION, BaseModel, Extra, Field
+from pydantic.fields import SHAPE_SET, ModelField
 
 S = TypeVar("S", bound="Base")
 T = TypeVar("T")
 
 _IGNORE_FIELDS = ["id", "ty"]
+# String fields whose few distinct values repeat across an entire ledger
+_INTERN_FIELDS = frozenset(["account", "currency", "flag"])
 _DIRECTIVES = [
     data.Balance,
     data.Close,
@@ -44,6 +59,11 @@ _DIRECTIVES = [
     data.Query,
     data.Transaction,
 ]
+# Disables copy_on_model_validation. pydantic 1.9 only accepts a boolean and
+# treats "none" as true, while 1.10 expects "none" and warns on a boolean.
+NO_COPY_ON_VALIDATION = (
+    False if tuple(map(int, VERSION.split(".")[:2])) < (1, 10) else "none"
+)
 
 
 def orjson_dumps(v, *, default):
@@ -58,9 +78,19 @@ class Base(BaseModel, Generic[T]):
     _sibling: Type[T]
 
     class Config:
+        # Models nested in another model are reused rather than copied
+        copy_on_model_validation = NO_COPY_ON_VALIDATION
         json_loads = orjson.loads
         json_dumps = orjson_dumps
 
+    def __eq__(self, other: Any) -> bool:
+        # Pydantic converts both models into dictionaries before comparing
+        # them, so compare the fields directly and let nested models do the
+        # same.
+        if isinstance(other, BaseModel):
+            return self.__dict__ == other.__dict__
+        return super().__eq__(other)
+
     def json(
         self,
         *,
@@ -99,34 +129,35 @@ class Base(BaseModel, Generic[T]):
             A new instance of this model
         """
         parsed = recursive_parse(obj)
-
-        # It's possible for tolerances to have a number.MISSING key which will
-        # fail validation
-        try:
-            parsed["meta"]["__tolerances__"] = {
-                k: v
-                for k, v in parsed["meta"]["__tolerances__"].items()
-                if k is not number.MISSING
-            }
-        except (KeyError, TypeError):
-            pass
-
-        # Generate a unique ID for directives parsed from a file
-        try:
-            parsed["id"] = hashlib.md5(
-                "".join(
-                    [
-                        os.path.basename(parsed["meta"]["filename"]),
-                        str(parsed["meta"]["lineno"]),
-                        str(parsed["date"]),
-                    ]
-                ).encode()
-            ).hexdigest()
-        except (KeyError, TypeError):
-            pass
+        _prepare(parsed)
 
         return cls.parse_obj(parsed)
 
+    @classmethod
+    def parse_trusted(cls: Type[S], obj: T) -> S:
+        """Parses a beancount type into this model without validating it.
+
+        Child models are built with Pydantic's `construct` method which skips
+        validation entirely. This is considerably faster than
+        [parse][bdantic.models.base.Base.parse] but should only be used with
+        data produced by beancount itself (i.e. the results of the loader), as
+        malformed input will silently produce a malformed model. Models which
+        provide their own parse method are always parsed with it.
+
+        Args:
+            obj: The Beancount type to parse
+
+        Returns:
+            A new instance of this model
+        """
+        if cls.parse.__func__ is not Base.parse.__func__:  # type: ignore
+            return cls.parse(obj)
+
+        parsed = obj._asdict()  # type: ignore
+        _prepare(parsed)
+
+        return cls.construct(**recursive_construct(cls, parsed))
+
     def export(self: S) -> T:
         """Exports this model into it's associated beancount type
 
@@ -247,12 +278,7 @@ class BaseList(BaseFiltered, Generic[S]):
     __root__: List[S]
 
     def _by_type(self, ty: Type[T]) -> List[T]:
-        result = []
-        for model in self:
-            if isinstance(model, ty):
-                result.append(model)
-
-        return result
+        return [model for model in self.__root__ if isinstance(model, ty)]
 
     def __len__(self) -> int:
         return len(self.__root__)
@@ -321,6 +347,7 @@ class Meta(BaseModel):
     tolerances: Optional[Dict[str, Decimal]] = Field(alias="__tolerances__")
 
     class Config:
+        copy_on_model_validation = NO_COPY_ON_VALIDATION
         extra = Extra.allow
 
 
@@ -330,6 +357,8 @@ def recursive_parse(b: Any) -> Dict[str, Any]:
     Since a NamedTuple can be represented as a dictionary using the bultin
     _asdict() method, this function attempts to recursively convert a
     BeancountTuple and any children types into a nested dictionary structure.
+    Account, currency, and flag strings are interned so that every model
+    shares a single copy of each.
 
     Args:
         b: The BeancountType to recursively parse
@@ -339,7 +368,9 @@ def recursive_parse(b: Any) -> Dict[str, Any]:
     """
     result: Dict[str, Any] = {}
     for key, value in b._asdict().items():
-        if hasattr(value, "_asdict"):
+        if key in _INTERN_FIELDS and type(value) is str:
+            result[key] = sys.intern(value)
+        elif hasattr(value, "_asdict"):
             result[key] = recursive_parse(value)
         elif isinstance(value, list) and value:
             if hasattr(value[0], "_asdict"):
@@ -352,6 +383,167 @@ def recursive_parse(b: Any) -> Dict[str, Any]:
     return result
 
 
+def recursive_construct(
+    model: Type[BaseModel], values: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Recursively converts the fields of a BeancountType into models.
+
+    This mirrors [recursive_parse][bdantic.models.base.recursive_parse] except
+    that child BeancountTypes are converted into their respective models using
+    `construct` rather than into dictionaries. The fields of the given model
+    are used to determine which model each child should be converted into.
+
+    Args:
+        model: The model the values belong to
+        values: The field values of a BeancountType
+
+    Returns:
+        A dictionary suitable for passing to `construct`
+    """
+    specs = _field_specs(model)
+    result: Dict[str, Any] = {}
+    for key, value in values.items():
+        spec = specs.get(key)
+        if spec is None:
+            result[key] = value
+        elif key in _INTERN_FIELDS and type(value) is str:
+            result[key] = sys.intern(value)
+        elif hasattr(value, "_asdict"):
+            result[key] = _construct_child(spec, value)
+        elif isinstance(value, list) and value:
+            if hasattr(value[0], "_asdict"):
+                result[key] = [_construct_child(spec, c) for c in value]
+            else:
+                result[key] = value
+        elif spec.is_set and isinstance(value, frozenset):
+            result[key] = set(value)
+        elif spec.model and isinstance(value, dict):
+            result[key] = spec.model.parse_obj(value)
+        else:
+            result[key] = value
+
+    return result
+
+
+class _FieldSpec(NamedTuple):
+    """Describes how the values of a field are converted by
+    [recursive_construct][bdantic.models.base.recursive_construct].
+
+    Attributes:
+        children: A mapping of BeancountTypes to the models the field accepts.
+        is_set: Whether the field holds a set.
+        model: The non-bdantic model the field holds (i.e. Meta), if any.
+    """
+
+    children: Dict[Type, Type[Base]]
+    is_set: bool
+    model: Optional[Type[BaseModel]]
+
+
+@functools.lru_cache(maxsize=None)
+def _field_specs(model: Type[BaseModel]) -> Dict[str, _FieldSpec]:
+    """Returns how each field of the given model is converted.
+
+    Inspecting the fields of a model is expensive relative to constructing it,
+    so the result is computed once per model and cached.
+
+    Args:
+        model: The model to inspect
+
+    Returns:
+        A dictionary of field names to their respective specs
+    """
+    specs: Dict[str, _FieldSpec] = {}
+    for name, field in model.__fields__.items():
+        children = {
+            m._sibling: m
+            for m in _field_models(field)
+            if hasattr(m, "_sibling")
+        }
+        ty = field.type_
+        specs[name] = _FieldSpec(
+            children=children,
+            is_set=field.shape == SHAPE_SET,
+            model=(
+                ty
+                if isinstance(ty, type)
+                and issubclass(ty, BaseModel)
+                and not issubclass(ty, Base)
+                else None
+            ),
+        )
+
+    return specs
+
+
+def _construct_child(spec: _FieldSpec, value: Any) -> Any:
+    """Converts a child BeancountType into the model accepted by its field.
+
+    Children which have no matching model are converted into dictionaries the
+    same way [recursive_parse][bdantic.models.base.recursive_parse] does.
+
+    Args:
+        spec: The spec of the field the child belongs to
+        value: The child BeancountType
+
+    Returns:
+        A model or dictionary representation of the child
+    """
+    model = spec.children.get(type(value))
+    if model is None:
+        return recursive_parse(value)
+
+    return model.construct(**recursive_construct(model, value._asdict()))
+
+
+def _field_models(field: ModelField) -> List[Type[Base]]:
+    """Returns the models accepted by the given field.
+
+    Args:
+        field: The field to inspect
+
+    Returns:
+        A list of models found in the field or any of its sub-fields
+    """
+    if field.sub_fields:
+        return [m for f in field.sub_fields for m in _field_models(f)]
+    elif isinstance(field.type_, type) and issubclass(field.type_, Base):
+        return [field.type_]
+    return []
+
+
+def _prepare(parsed: Dict[str, Any]) -> None:
+    """Prepares the fields of a parsed BeancountType for a model.
+
+    Args:
+        parsed: The fields of the BeancountType, modified in place
+    """
+    # It's possible for tolerances to have a number.MISSING key which will
+    # fail validation
+    try:
+        parsed["meta"]["__tolerances__"] = {
+            k: v
+            for k, v in parsed["meta"]["__tolerances__"].items()
+            if k is not number.MISSING
+        }
+    except (KeyError, TypeError):
+        pass
+
+    # Generate a unique ID for directives parsed from a file
+    try:
+        parsed["id"] = hashlib.md5(
+            "".join(
+                [
+                    os.path.basename(parsed["meta"]["filename"]),
+                    str(parsed["meta"]["lineno"]),
+                    str(parsed["date"]),
+                ]
+            ).encode()
+        ).hexdigest()
+    except (KeyError, TypeError):
+        pass
+
+
 def recursive_export(b: Any, skip_fields: List[str] = []) -> Dict[str, Any]:
     """Recursively exports a ModelTuple into a nested dictionary
 
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import datetime
 from decimal import Decimal
-from typing import List, Literal, Optional
+from typing import Dict, List, Literal, Optional
 
 from beancount.core import amount, inventory, position
 
@@ -97,6 +97,25 @@ class Inventory(BaseList):
         positions = [position.export() for position in self.__root__]
         return inventory.Inventory(positions=positions)
 
+    def split(self) -> Dict[str, Inventory]:
+        """Splits this inventory into one inventory per currency.
+
+        This mirrors `beancount.core.inventory.Inventory.split`, but works on
+        the already parsed positions so they don't need to be parsed again.
+        The returned inventories share their Position instances with this
+        inventory.
+
+        Returns:
+            A dictionary of currencies to their respective inventories.
+        """
+        split: Dict[str, List[Position]] = {}
+        for pos in self.__root__:
+            # Only incomplete amounts lack a currency, never held positions
+            assert pos.units.currency is not None
+            split.setdefault(pos.units.currency, []).append(pos)
+
+        return {k: Inventory.construct(__root__=v) for k, v in split.items()}
+
 
 class Position(Base):
     """A model representing a `beancount.core.position.Position`.
@@ -5,15 +5,25 @@ from __future__ import annotations
 import lzma
 import pickle
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Set, Tuple, Type, TypeVar
+from typing import (
+    Annotated,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
 from beancount import loader
 from beancount.core import data, realization
 from beancount.query import query
-from pydantic import Extra
+from pydantic import Extra, Field
 
 from bdantic import models
-from bdantic.types import ModelDirective, type_map
+from bdantic.types import ModelDirective, model_types, type_map
 
 from .base import Base, BaseList
 from .query import QueryResult
@@ -22,7 +32,7 @@ from .realize import Account, RealAccount
 T = TypeVar("T", bound="ModelDirective")
 
 
-class Directives(BaseList, smart_union=True):
+class Directives(BaseList):
     """A model representing a list of directives.
 
     This models wraps the entries response often returned when loading the
@@ -30,22 +40,33 @@ class Directives(BaseList, smart_union=True):
     models.
     """
 
-    __root__: List[ModelDirective]
+    # Each directive is validated against the model named by its ty field
+    # rather than trying every model in turn
+    __root__: List[Annotated[ModelDirective, Field(discriminator="ty")]]
 
     @classmethod
-    def parse(cls, obj: List[data.Directive]) -> Directives:
+    def parse(
+        cls, obj: List[data.Directive], trusted: bool = False
+    ) -> Directives:
         """Parses a list of beancount directives into this model
 
         Args:
             obj: The Beancount directives to parse
+            trusted: Whether to skip validating the parsed directives, see
+                [parse_trusted][bdantic.models.base.Base.parse_trusted]
 
         Returns:
             A new instance of this model
         """
-        dirs = []
+        if trusted:
+            dirs = [
+                type_map[type(d)].parse_trusted(d) for d in obj  # type: ignore
+            ]
+        else:
+            dirs = [type_map[type(d)].parse(d) for d in obj]  # type: ignore
 
-        dirs = [type_map[type(d)].parse(d) for d in obj]  # type: ignore
-        return Directives(__root__=dirs)
+        # Every element was just parsed, so there is no need to validate them
+        return Directives.construct(__root__=dirs)
 
     def export(self) -> List[data.Directive]:
         """Exports this model into a list of beancount directives
@@ -89,7 +110,7 @@ class Directives(BaseList, smart_union=True):
                         if v == account:
                             result.append(dir)
 
-        return Directives(__root__=result)
+        return Directives.construct(__root__=result)
 
     def by_id(self, id: str) -> ModelDirective:
         """Returns the directive with the given ID.
@@ -103,11 +124,13 @@ class Directives(BaseList, smart_union=True):
         Returns:
             The directive.
         """
-        id_map = {d.id: d for d in self}
-        if id not in id_map:
-            raise IDNotFoundError(f"Failed to find directive with ID: {id}")
+        # IDs are not unique (i.e. the transaction inserted for a pad shares
+        # its ID), so the last match is returned to agree with by_ids
+        for d in reversed(self.__root__):
+            if d.id == id:
+                return d
 
-        return id_map[id]
+        raise IDNotFoundError(f"Failed to find directive with ID: {id}")
 
     def by_ids(self, ids: List[str]) -> List[ModelDirective]:
         """Returns a list of directives matching the given ID's.
@@ -121,9 +144,16 @@ class Directives(BaseList, smart_union=True):
         Returns:
             A list of the directives.
         """
+        # Index the directives once rather than scanning them for every ID
+        id_map = {d.id: d for d in self.__root__}
+
         result = []
         for id in ids:
-            result.append(self.by_id(id))
+            if id not in id_map:
+                raise IDNotFoundError(
+                    f"Failed to find directive with ID: {id}"
+                )
+            result.append(id_map[id])
 
         return result
 
@@ -136,7 +166,7 @@ class Directives(BaseList, smart_union=True):
         Returns:
             A new instance of `Directives` with the filtered results.
         """
-        return Directives(__root__=super()._by_type(ty))
+        return Directives.construct(__root__=super()._by_type(ty))
 
 
 class Options(Base):
@@ -200,7 +230,7 @@ class Options(Base):
         """
         d = {}
         for key, value in obj.items():
-            if type(value) in type_map.keys():
+            if type(value) in type_map:
                 d[key] = type_map[type(value)].parse(value)
             else:
                 d[key] = value
@@ -215,7 +245,7 @@ class Options(Base):
         """
         d = {}
         for key, value in self.__dict__.items():
-            if type(value) in type_map.values():
+            if type(value) in model_types:
                 d[key] = value.export()  # type: ignore
             else:
                 d[key] = value
@@ -246,25 +276,30 @@ class BeancountFile(Base):
     def parse(
         cls,
         obj: Tuple[List[data.Directive], List[Any], Dict[str, Any]],
+        trusted: bool = False,
     ) -> BeancountFile:
         """Parses the results of loading a beancount file into this model.
 
         Args:
             obj: The results from calling the beancount loader
+            trusted: Whether to skip validating the parsed entries, see
+                [parse_trusted][bdantic.models.base.Base.parse_trusted]
 
         Returns:
             A new instance of this model
         """
-        entries = Directives.parse(obj[0])
+        entries = Directives.parse(obj[0], trusted)
         errors = obj[1]
         options = Options.parse(obj[2])
 
+        # Read the opened accounts from the raw entries rather than filtering
+        # the parsed models, which would build a second Directives model
         real = realization.realize(obj[0])
-        names = [o.account for o in entries.by_type(models.Open)]
-
-        accounts = {}
-        for name in names:
-            accounts[name] = Account.parse(realization.get(real, name))
+        accounts = {
+            e.account: Account.parse(realization.get(real, e.account))
+            for e in obj[0]
+            if type(e) is data.Open
+        }
 
         return BeancountFile(
             entries=entries,
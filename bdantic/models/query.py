@@ -10,7 +10,7 @@ from typing import Any, Dict, List, Literal, Tuple, Type
 from beancount.core import amount, inventory, position
 from pydantic import BaseModel
 
-from ..types import type_map
+from ..types import model_types, type_map
 from .base import Base
 
 QueryRow = Dict[str, Any]
@@ -79,7 +79,7 @@ class QueryResult(Base):
         for row in obj[1]:
             d = row._asdict()
             for k, v in d.items():
-                if type(v) in type_map.keys():
+                if type(v) in type_map:
                     d[k] = type_map[type(v)].parse(v)
 
             rows.append(d)
@@ -106,7 +106,7 @@ class QueryResult(Base):
         for row in self.rows:
             values = []
             for key in column_names:
-                if type(row[key]) in type_map.values():
+                if type(row[key]) in model_types:
                     values.append(row[key].export())
                 else:
                     values.append(row[key])
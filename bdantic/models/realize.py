@@ -2,13 +2,26 @@
 
 from __future__ import annotations
 
+import sys
 from datetime import date
-from typing import Dict, List, Literal, Optional, Type, TypeVar, Union
+from typing import (
+    Annotated,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Set,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from beancount.core import data, realization
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, PrivateAttr
 
-from .base import Base, BaseList
+from .base import NO_COPY_ON_VALIDATION, Base, BaseList
 from .data import Account as AccountName
 from .data import Inventory
 from .directives import Balance, Close, Document, Note, Open, Pad, TxnPosting
@@ -36,6 +49,11 @@ _type_map: Dict[Type[BeanTxnPosting], Type[ModelTxnPosting]] = {
     data.TxnPosting: TxnPosting,
 }
 
+# Resolves the parse method of each model once instead of for every posting
+_parse_map: Dict[Type[BeanTxnPosting], Callable[[Any], ModelTxnPosting]] = {
+    k: v.parse for k, v in _type_map.items()
+}
+
 
 class Account(BaseModel):
     """A simplified view of an entire beancount account.
@@ -58,6 +76,9 @@ class Account(BaseModel):
     name: str
     open: date
 
+    class Config:
+        copy_on_model_validation = NO_COPY_ON_VALIDATION
+
     @staticmethod
     def parse(obj: realization.RealAccount) -> Account:
         """Parses a beancount RealAccount into this model
@@ -65,24 +86,26 @@ class Account(BaseModel):
         Args:
             obj: The Beancount RealAccount
 
+        Raises:
+            ValueError: If the account has no Open directive.
+
         Returns:
             A new instance of this model
         """
         open_date = None
         close_date = None
         for dir in obj.txn_postings:
-            if isinstance(dir, data.Open):
+            if type(dir) is data.Open:
                 open_date = dir.date
-            elif isinstance(dir, data.Close):
+            elif type(dir) is data.Close:
                 close_date = dir.date
 
-        split = obj.balance.split()
-        map = {}
-        for k, v in split.items():
-            map[k] = Inventory.parse(v)
+        if open_date is None:
+            raise ValueError(f"Account has no Open directive: {obj.account}")
 
-        return Account(
-            balance=map,
+        # The balance is built from parsed models and needs no validation
+        return Account.construct(
+            balance=Inventory.parse(obj.balance).split(),
             close=close_date,
             open=open_date,
             name=obj.account,
@@ -99,21 +122,23 @@ class Account(BaseModel):
         Returns:
             A new instance of Account
         """
-        open = ra.txn_postings.by_type(Open)
-        assert open is not None
-        assert len(open) == 1
-
-        close = ra.txn_postings.by_type(Close)
-        if close:
-            assert len(close) < 2
-            close_date = close[0].date
-        else:
-            close_date = None
-
-        return Account(
-            balance=ra.cur_map,
+        open_date = None
+        close_date = None
+        for dir in ra.txn_postings:
+            if type(dir) is Open:
+                assert open_date is None
+                open_date = dir.date
+            elif type(dir) is Close:
+                assert close_date is None
+                close_date = dir.date
+
+        assert open_date is not None
+
+        # The balance was validated when the RealAccount was created
+        return Account.construct(
+            balance=dict(ra.cur_map),
             close=close_date,
-            open=open[0].date,
+            open=open_date,
             name=ra.account,
         )
 
@@ -145,6 +170,23 @@ class RealAccount(Base, smart_union=True):
     cur_map: Dict[str, Inventory]
     txn_postings: TxnPostings
 
+    _account: Optional[Account] = PrivateAttr(default=None)
+
+    def __setattr__(self, name: str, value: Any):
+        super().__setattr__(name, value)
+
+        # Any change to the fields invalidates the cached Account
+        if name != "_account":
+            self._account = None
+
+    def _copy_and_set_values(
+        self, values: Dict[str, Any], fields_set: Set[str], *, deep: bool
+    ) -> RealAccount:
+        # copy() carries private attributes over, including the cached Account
+        ra = super()._copy_and_set_values(values, fields_set, deep=deep)
+        ra._account = None
+        return ra
+
     @classmethod
     def parse(cls, obj: realization.RealAccount) -> RealAccount:
         """Parses a beancount RealAccount into this model
@@ -155,20 +197,16 @@ class RealAccount(Base, smart_union=True):
         Returns:
             A new instance of this model
         """
-        children = {}
-        for k, v in obj.items():
-            children[k] = RealAccount.parse(v)
+        children = {k: RealAccount.parse(v) for k, v in obj.items()}
 
-        split = obj.balance.split()
-        map = {}
-        for k, v in split.items():
-            map[k] = Inventory.parse(v)
+        balance = Inventory.parse(obj.balance)
 
+        # Account names repeat across the tree, so share a single copy of each
         return RealAccount(
-            account=obj.account,
-            balance=Inventory.parse(obj.balance),
+            account=sys.intern(obj.account),
+            balance=balance,
             children=children,
-            cur_map=map,
+            cur_map=balance.split(),
             txn_postings=TxnPostings.parse(obj.txn_postings),  # type: ignore
         )
 
@@ -209,24 +247,34 @@ class RealAccount(Base, smart_union=True):
     def to_account(self) -> Account:
         """Converts this RealAccount into an Account instance.
 
+        The result is cached on this instance and reused by later calls until
+        one of its fields is reassigned. Changes made in place to nested
+        values (i.e. appending to `txn_postings`) are not detected. The same
+        Account instance is returned by every call, so it should be copied
+        before being modified.
+
         Returns:
-            A new Account instance
+            An Account instance
         """
-        return Account.from_real(self)
+        if self._account is None:
+            self._account = Account.from_real(self)
+
+        return self._account
 
 
 class TxnPostings(BaseList):
     """A model representing the txnpostings found within RealAccount's."""
 
-    __root__: List[ModelTxnPosting]
+    __root__: List[Annotated[ModelTxnPosting, Field(discriminator="ty")]]
 
     @classmethod
     def parse(
         cls,
         obj: List[BeanTxnPosting],
     ) -> TxnPostings:
-        return TxnPostings(
-            __root__=[_type_map[type(d)].parse(d) for d in obj]  # type: ignore
+        # Every element was just parsed, so there is no need to validate them
+        return TxnPostings.construct(
+            __root__=[_parse_map[type(d)](d) for d in obj]  # type: ignore
         )
 
     def export(self) -> List[BeanTxnPosting]:
@@ -241,7 +289,7 @@ class TxnPostings(BaseList):
         Returns:
             A new instance of `TxnPostings` with the filtered results.
         """
-        return TxnPostings(__root__=super()._by_type(ty))
+        return TxnPostings.construct(__root__=super()._by_type(ty))
 
 
 # Update forward references
@@ -6,7 +6,7 @@ method. However, most of these functions take any supported type/model as an
 input which results in less imports in your code.
 """
 
-from typing import Any, Dict, List, Sequence, Tuple, Type
+from typing import Any, Callable, Dict, List, Sequence, Tuple, Type
 
 from beancount.core import data
 
@@ -14,6 +14,14 @@ from bdantic.models.file import BeancountFile, Directives
 from bdantic.models.query import QueryResult
 from bdantic.types import BeancountType, Model, type_map
 
+# Resolves the parse method of each model once instead of on every call
+_parse_map: Dict[Type[BeancountType], Callable[[Any], Model]] = {
+    k: v.parse for k, v in type_map.items()
+}
+_parse_trusted_map: Dict[Type[BeancountType], Callable[[Any], Model]] = {
+    k: v.parse_trusted for k, v in type_map.items()
+}
+
 
 def export(model: Model) -> BeancountType:
     """Exports a Model to its respective BeancountType.
@@ -39,47 +47,58 @@ def export_all(models: Sequence[Model]) -> List[BeancountType]:
     return [export(model) for model in models]
 
 
-def parse(obj: BeancountType) -> Model:
+def parse(obj: BeancountType, trusted: bool = False) -> Model:
     """Parses a BeancountType into it's respective Model.
 
     Args:
         obj: A valid BeancountType
+        trusted: Whether to skip validating the resulting Model
 
     Returns:
         The associated Model for the given BeancountType
     """
-    return type_map[type(obj)].parse(obj)  # type: ignore
+    if trusted:
+        return _parse_trusted_map[type(obj)](obj)
+    return _parse_map[type(obj)](obj)
 
 
 def parse_all(
-    objs: Sequence[BeancountType],
+    objs: Sequence[BeancountType], trusted: bool = False
 ) -> List[Model]:
     """Parses a list of BeancountTypes's into a list of their respective
     Models.
 
     Args:
         objs: A list of valid BeancountType's
+        trusted: Whether to skip validating the resulting Models
 
     Returns:
         A list of associated Models for each BeancountType
     """
-    return [parse(obj) for obj in objs]
+    parse_map = _parse_trusted_map if trusted else _parse_map
+    return [parse_map[type(obj)](obj) for obj in objs]
 
 
-def parse_directives(entries: List[data.Directive]) -> Directives:
+def parse_directives(
+    entries: List[data.Directive], trusted: bool = False
+) -> Directives:
     """Parses a list of directives into a Directives model.
 
     Args:
         entries: The list of directives as returned by the parser
+        trusted: Whether to skip validating the parsed directives
 
     Returns:
         A Directives instance
     """
-    return Directives.parse(entries)
+    return Directives.parse(entries, trusted)
 
 
 def parse_loader(
-    entries: List[data.Directive], errors: List[Any], options: Dict[str, Any]
+    entries: List[data.Directive],
+    errors: List[Any],
+    options: Dict[str, Any],
+    trusted: bool = False,
 ) -> BeancountFile:
     """Parses the result from calling the beancount loader to a BeancountFile.
 
@@ -87,15 +106,16 @@ def parse_loader(
         entries: The entries return from the loader
         errors: The errors returned from a loader
         options: The options returned from a loder
+        trusted: Whether to skip validating the parsed entries
 
     Returns:
         A BeancountFile model
     """
-    return BeancountFile.parse((entries, errors, options))
+    return BeancountFile.parse((entries, errors, options), trusted)
 
 
 def parse_query(
-    query_result: Tuple[List[Tuple[str, Type]], List[Any]]
+    query_result: Tuple[List[Tuple[str, Type]], List[Any]],
 ) -> QueryResult:
     """Parses the response from running query.run_query() on a list of entries.
 
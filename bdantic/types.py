@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from decimal import Decimal
-from typing import Dict, List, Type, Union
+from typing import Dict, FrozenSet, List, Type, Union
 
 from beancount.core import (
     amount,
@@ -62,6 +62,9 @@ type_map: Dict[Type[BeancountType], Type[Model]] = {
     data.TxnPosting: TxnPosting,
 }
 
+# The models found in type_map, for checking whether a value is a model
+model_types: FrozenSet[Type[Model]] = frozenset(type_map.values())
+
 # A union for all models that are directives
 ModelDirective = Union[
     Balance,
@@ -7,14 +7,18 @@ from bdantic.models import base
 from bdantic.models import data as mdata
 from bdantic.models import directives
 
+_NUMBER = Decimal("1.50")
+_TODAY = date.today()
+_META = {
+    "filename": "test.beancount",
+    "lineno": 123,
+}
+
 
 def test_recursive_parse():
     txn = data.Transaction(
-        meta={
-            "filename": "test.beancount",
-            "lineno": 123,
-        },
-        date=date.today(),
+        meta=_META,
+        date=_TODAY,
         flag="*",
         payee="test",
         narration="test",
@@ -23,7 +27,7 @@ def test_recursive_parse():
         postings=[
             data.Posting(
                 account="Test",
-                units=amount.Amount(number=Decimal(1.50), currency="USD"),
+                units=amount.Amount(number=_NUMBER, currency="USD"),
                 cost=None,
                 price=None,
                 flag=None,
@@ -33,11 +37,8 @@ def test_recursive_parse():
     )
 
     expected = {
-        "meta": {
-            "filename": "test.beancount",
-            "lineno": 123,
-        },
-        "date": date.today(),
+        "meta": _META,
+        "date": _TODAY,
         "flag": "*",
         "payee": "test",
         "narration": "test",
@@ -47,7 +48,7 @@ def test_recursive_parse():
             {
                 "account": "Test",
                 "units": {
-                    "number": Decimal(1.50),
+                    "number": _NUMBER,
                     "currency": "USD",
                 },
                 "cost": None,
@@ -63,22 +64,19 @@ def test_recursive_parse():
 
 
 def test_recursive_export():
-    txn = directives.Transaction(
+    txn = directives.Transaction.construct(
         id="",
-        meta={
-            "filename": "test.beancount",
-            "lineno": 123,
-        },
-        date=date.today(),
+        meta=_META,
+        date=_TODAY,
         flag="*",
         payee="test",
         narration="test",
         tags=None,
         links=None,
         postings=[
-            directives.Posting(
+            directives.Posting.construct(
                 account="Test",
-                units=mdata.Amount(number=Decimal(1.50), currency="USD"),
+                units=mdata.Amount.construct(number=_NUMBER, currency="USD"),
                 cost=None,
                 price=None,
                 flag=None,
@@ -88,11 +86,8 @@ def test_recursive_export():
     )
 
     expected = {
-        "meta": {
-            "filename": "test.beancount",
-            "lineno": 123,
-        },
-        "date": date.today(),
+        "meta": _META,
+        "date": _TODAY,
         "flag": "*",
         "payee": "test",
         "narration": "test",
@@ -101,7 +96,7 @@ def test_recursive_export():
         "postings": [
             data.Posting(
                 account="Test",
-                units=amount.Amount(number=Decimal(1.50), currency="USD"),
+                units=amount.Amount(number=_NUMBER, currency="USD"),
                 cost=None,
                 price=None,
                 flag=None,
@@ -112,3 +107,40 @@ def test_recursive_export():
 
     result = base.recursive_export(txn, base._IGNORE_FIELDS)
     assert result == expected
+
+
+def test_eq():
+    amt = mdata.Amount(number=_NUMBER, currency="USD")
+
+    assert amt == mdata.Amount(number=_NUMBER, currency="USD")
+    assert amt != mdata.Amount(number=_NUMBER, currency="EUR")
+    assert amt == amt.dict()
+
+    txn = directives.Transaction(
+        date=_TODAY,
+        flag="*",
+        narration="test",
+        postings=[directives.Posting(account="Test", units=amt)],
+    )
+    other = txn.copy(deep=True)
+    assert txn == other
+
+    other.postings[0].account = "Other"
+    assert txn != other
+
+
+def test_no_copy_on_validation():
+    amt = mdata.Amount(number=_NUMBER, currency="USD")
+    meta = base.Meta(filename="test.beancount", lineno=123)
+    posting = directives.Posting(account="Test", units=amt)
+    txn = directives.Transaction(
+        date=_TODAY,
+        meta=meta,
+        flag="*",
+        narration="test",
+        postings=[posting],
+    )
+
+    assert txn.meta is meta
+    assert txn.postings[0] is posting
+    assert txn.postings[0].units is amt
@@ -1,22 +1,82 @@
 import datetime
+import functools
 import hashlib
 import io
 import os
 import pickle
 import random
-from typing import Any, List, Type
+from dataclasses import dataclass
+from typing import Any, FrozenSet, Set, Type
 
 import pytest
 from beancount import loader
-from beancount.core import data, distribution
+from beancount.core import data, display_context, distribution
 from beancount.scripts import example  # type: ignore
+from hypothesis import HealthCheck, Phase, settings
 from pydantic import BaseModel
 
-from bdantic import models, types
+from bdantic import models
 from bdantic.models import base
 
+# The fast profile keeps local and CI runs short, the ci profile is used by the
+# nightly workflow and trades run time for more examples, skipping shrinking
+# since failures are reproduced locally
+settings.register_profile(
+    "fast",
+    max_examples=25,
+    deadline=None,
+    suppress_health_check=[HealthCheck.too_slow],
+)
+settings.register_profile(
+    "ci",
+    max_examples=200,
+    deadline=None,
+    phases=[Phase.explicit, Phase.reuse, Phase.generate],
+    suppress_health_check=[HealthCheck.too_slow],
+)
+settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "fast"))
+
+
+# Models which wrap their value in a __root__ field
+_ROOT_TYPES = frozenset(
+    m
+    for m in vars(models).values()
+    if isinstance(m, type)
+    and issubclass(m, BaseModel)
+    and "__root__" in m.__fields__
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _class_attributes(cls: type) -> FrozenSet[str]:
+    """Returns the names of the attributes of a class which are not methods.
+
+    The class dictionaries are inspected directly so that no property or
+    other descriptor is invoked.
 
-class Ctx(BaseModel):
+    Args:
+        cls: The class to inspect
+
+    Returns:
+        A set of attribute names
+    """
+
+    def is_method(name: str) -> bool:
+        for klass in cls.__mro__:
+            if name in klass.__dict__:
+                value = klass.__dict__[name]
+                return callable(value) or isinstance(
+                    value, (classmethod, staticmethod)
+                )
+        return False
+
+    return frozenset(
+        k for k in dir(cls) if not k.startswith("__") and not is_method(k)
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class Ctx:
     """Holds contextual information when comparing values.
 
     Attributes:
@@ -24,22 +84,25 @@ class Ctx(BaseModel):
         recurse: The types of objects to recursively compare
     """
 
-    recurse: List[Type] = [
-        models.Amount,
-        models.Close,
-        models.Cost,
-        models.CostSpec,
-        models.CurrencyContext,
-        models.DisplayContext,
-        distribution.Distribution,
-        models.Distribution,
-        base.Meta,
-        models.Open,
-        models.Posting,
-        models.Position,
-        models.Transaction,
-        models.TxnPosting,
-    ]
+    recurse: FrozenSet[Type] = frozenset(
+        [
+            models.Amount,
+            models.Close,
+            models.Cost,
+            models.CostSpec,
+            models.CurrencyContext,
+            display_context._CurrencyContext,
+            models.DisplayContext,
+            distribution.Distribution,
+            models.Distribution,
+            base.Meta,
+            models.Open,
+            models.Posting,
+            models.Position,
+            models.Transaction,
+            models.TxnPosting,
+        ]
+    )
 
     def is_recurse(self, obj1: Any, obj2: Any) -> bool:
         """Returns whether or not the two objects should be recursed.
@@ -71,9 +134,9 @@ class Ctx(BaseModel):
         Raises:
             AssertionError when an equality check fails
         """
-        if hasattr(obj1, "__root__"):
+        if type(obj1) in _ROOT_TYPES:
             obj1 = obj1.__root__
-        elif hasattr(obj2, "__root__"):
+        elif type(obj2) in _ROOT_TYPES:
             obj2 = obj2.__root__
 
         if self.is_recurse(obj1, obj2):
@@ -98,9 +161,9 @@ class Ctx(BaseModel):
         Raises:
             AssertionError when an equality check fails
         """
-        assert not set(dict1.keys()).difference(set(dict2.keys()))
-        for key in dict1:
-            self.compare(dict1[key], dict2[key], partial)
+        assert dict1.keys() <= dict2.keys()
+        for key, value in dict1.items():
+            self.compare(value, dict2[key], partial)
 
     def compare_list(self, list1, list2, partial: bool = True) -> None:
         """Compares two lists, asserting they are equal.
@@ -114,8 +177,36 @@ class Ctx(BaseModel):
             AssertionError when an equality check fails
         """
         assert len(list1) == len(list2)
-        for i in range(len(list1)):
-            self.compare(list1[i], list2[i], partial)
+        for item1, item2 in zip(list1, list2):
+            self.compare(item1, item2, partial)
+
+    @staticmethod
+    def attributes(obj: Any) -> Set[str]:
+        """Returns the names of the attributes of an object to compare.
+
+        NamedTuples and models list their attributes directly, all other
+        objects fall back to scanning for attributes which are not methods.
+        The attributes found on the class are only scanned for once.
+
+        Args:
+            obj: The object to inspect
+
+        Returns:
+            A set of attribute names
+        """
+        if isinstance(obj, tuple) and hasattr(obj, "_fields"):
+            return set(getattr(obj, "_fields"))
+        elif isinstance(obj, BaseModel):
+            return set(obj.__dict__)
+
+        # dir() of an instance is its class attributes plus its own
+        cls: type = type(obj)
+        attrs = _class_attributes(cls)
+        instance = getattr(obj, "__dict__", None)
+        if instance:
+            return {k for k in instance if not k.startswith("__")} | attrs
+
+        return set(attrs)
 
     def compare_object(
         self, obj1: Any, obj2: Any, partial: bool = True
@@ -137,16 +228,8 @@ class Ctx(BaseModel):
         Raises:
             AssertionError when an equality check fails
         """
-
-        def is_valid_attr(k: str, obj: Any) -> bool:
-            if k.startswith("__"):
-                return False
-            elif callable(getattr(obj, k)):
-                return False
-            return True
-
-        attr1 = set([attr for attr in dir(obj1) if is_valid_attr(attr, obj1)])
-        attr2 = set([attr for attr in dir(obj2) if is_valid_attr(attr, obj2)])
+        attr1 = self.attributes(obj1)
+        attr2 = self.attributes(obj2)
 
         if not partial:
             assert not attr1.difference(
@@ -188,41 +271,6 @@ def beanfile() -> tuple[list[data.Directive], list, dict[str, Any]]:
         return loader.load_string(s.read())
 
 
-@pytest.fixture(scope="session")
-def syntax() -> list[tuple[str, type[types.ModelDirective]]]:
-    balance = "2022-01-01 balance Assets:US:BofA:Checking        2845.77 USD"
-    close = "2022-01-01 close Equity:Opening-Balances"
-    commodity = """2022-01-01 commodity USD
-    export: "CASH"
-    name: "US Dollar" """
-    document = f"""
-    2022-01-01 document Assets:US:Vanguard:Cash "{os.getcwd()}/test.doc" """
-    event = """2022-01-01 event "location" "Paris, France" """
-    note = """2022-01-01 note Liabilities:Credit "Called about fraudulence" """
-    open = """2022-01-01 open Liabilities:Credit:CapitalOne     USD"""
-    pad = "2022-01-01 pad Assets:BofA:Checking Equity:Opening-Balances"
-    price = "2022-01-01 price HOOL  579.18 USD"
-    query = """2022-01-01 query "france-balances" "
-    SELECT account, sum(position) WHERE `trip-france-2014` in tags" """
-    transaction = """2022-01-01 * "Investing 40% of cash in VBMPX"
-    Assets:US:Vanguard:VBMPX    1.122 VBMPX {213.90 USD, 2022-01-01}
-    Assets:US:Vanguard:Cash   -240.00 USD"""
-
-    return [
-        (balance, models.Balance),
-        (close, models.Close),
-        (commodity, models.Commodity),
-        (document, models.Document),
-        (event, models.Event),
-        (note, models.Note),
-        (open, models.Open),
-        (pad, models.Pad),
-        (price, models.Price),
-        (query, models.Query),
-        (transaction, models.Transaction),
-    ]
-
-
 def hash(obj) -> str:
     """Hashes the given object.
 
@@ -57,6 +57,12 @@ def test_inventory(ctx: Ctx, pos: List[position.Position]):
     ctx.compare_object(pinv, inv)
     ctx.compare_object(pinv.export(), inv, False)
 
+    split = inv.split()
+    psplit = pinv.split()
+    assert psplit.keys() == split.keys()
+    for currency, pcinv in psplit.items():
+        assert pcinv.export() == split[currency]
+
 
 @given(h.position())
 def test_position(ctx: Ctx, pos: position.Position):
@@ -1,4 +1,8 @@
+import os
+from typing import Type
+
 import beancount_hypothesis as h
+import pytest
 from beancount.core import data
 from beancount.parser import parser  # type: ignore
 from beancount_hypothesis.directive import query
@@ -7,17 +11,66 @@ from hypothesis import given
 
 from bdantic.models import directives
 
-
-def test_syntax(syntax):
+# Pairs of beancount syntax and the models they are expected to parse into
+_SNIPPETS = [
+    (
+        "2022-01-01 balance Assets:US:BofA:Checking        2845.77 USD",
+        directives.Balance,
+    ),
+    ("2022-01-01 close Equity:Opening-Balances", directives.Close),
+    (
+        """2022-01-01 commodity USD
+    export: "CASH"
+    name: "US Dollar" """,
+        directives.Commodity,
+    ),
+    (
+        f"""
+    2022-01-01 document Assets:US:Vanguard:Cash "{os.getcwd()}/test.doc" """,
+        directives.Document,
+    ),
+    (
+        """2022-01-01 event "location" "Paris, France" """,
+        directives.Event,
+    ),
+    (
+        """2022-01-01 note Liabilities:Credit "Called about fraudulence" """,
+        directives.Note,
+    ),
+    (
+        """2022-01-01 open Liabilities:Credit:CapitalOne     USD""",
+        directives.Open,
+    ),
+    (
+        "2022-01-01 pad Assets:BofA:Checking Equity:Opening-Balances",
+        directives.Pad,
+    ),
+    ("2022-01-01 price HOOL  579.18 USD", directives.Price),
+    (
+        """2022-01-01 query "france-balances" "
+    SELECT account, sum(position) WHERE `trip-france-2014` in tags" """,
+        directives.Query,
+    ),
+    (
+        """2022-01-01 * "Investing 40% of cash in VBMPX"
+    Assets:US:Vanguard:VBMPX    1.122 VBMPX {213.90 USD, 2022-01-01}
+    Assets:US:Vanguard:Cash   -240.00 USD""",
+        directives.Transaction,
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    ("text", "model"), _SNIPPETS, ids=[m.__name__ for _, m in _SNIPPETS]
+)
+def test_syntax(text: str, model: Type[directives.BaseDirective]):
     def strip(s: str) -> str:
         return s.strip().replace(" ", "").replace("\n", "")
 
-    for test in syntax:
-        d = parser.parse_string(test[0])[0][0]
-        pd = test[1].parse(d)
-        syn = pd.syntax()
+    d = parser.parse_string(text)[0][0]
+    pd = model.parse(d)
 
-        assert strip(test[0]) == strip(syn)
+    assert strip(text) == strip(pd.syntax())
 
 
 @given(h.balance())
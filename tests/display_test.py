@@ -51,7 +51,7 @@ def test_displaycontext(ctx: Ctx, c: display.DisplayContext):
         bcc.has_sign = cc.has_sign
         bcc.integer_max = cc.integer_max
         bcc.fractional_dist = bd
-        ccs[key] = cc
+        ccs[key] = bcc
 
     bdc = display_context.DisplayContext()
     bdc.ccontexts = ccs
@@ -3,6 +3,7 @@ from unittest import mock
 
 import beancount_hypothesis as h
 import pytest
+from beancount import loader
 from beancount.core import data
 from beancount_hypothesis.directive import query
 from conftest import Ctx
@@ -12,6 +13,16 @@ from hypothesis import strategies as s
 from bdantic import types
 from bdantic.models import directives, file
 
+# Values which may appear in the beancount options
+_OPTION_VALUES = s.one_of(
+    s.booleans(),
+    s.text(),
+    s.integers(),
+    s.decimals(allow_nan=False),
+    s.sampled_from(data.Booking),
+    s.lists(s.text()),
+)
+
 
 def reject(obj):
     if not isinstance(obj, list):
@@ -48,6 +59,9 @@ def test_directives(ctx: Ctx, d: List[data.Directive]):
     for i, en in enumerate(pd):
         ctx.compare_object(en, d[i])
 
+    # Dictionaries are validated into the model named by their ty field
+    assert file.Directives.parse_obj([en.dict() for en in pd]) == pd
+
 
 @given(
     h.open(),
@@ -55,7 +69,7 @@ def test_directives(ctx: Ctx, d: List[data.Directive]):
     h.transaction(),
 )
 def test_directives_by_account(op, bal, txn):
-    if len(set([op.account, bal.account, txn.postings[0].account])) != 3:
+    if len({op.account, bal.account, txn.postings[0].account}) != 3:
         return
 
     dirs = file.Directives.parse([op, bal, txn])
@@ -86,6 +100,24 @@ def test_directives_by_id(op, bal, txn):
     with pytest.raises(file.IDNotFoundError):
         dirs.by_id("a")
 
+    with pytest.raises(file.IDNotFoundError):
+        dirs.by_ids([pop.id, "a"])
+
+
+def test_directives_by_id_duplicate():
+    # The transaction inserted by the pad plugin shares the pad's ID
+    entries, _, _ = loader.load_string(
+        "2022-01-01 open Assets:Cash\n"
+        "2022-01-01 open Equity:Opening\n"
+        "2022-01-02 pad Assets:Cash Equity:Opening\n"
+        "2022-01-03 balance Assets:Cash 100 USD\n"
+    )
+    dirs = file.Directives.parse(entries)
+    pad = dirs.by_type(directives.Pad)[0]
+
+    assert isinstance(dirs.by_id(pad.id), directives.Transaction)
+    assert dirs.by_ids([pad.id]) == [dirs.by_id(pad.id)]
+
 
 @given(h.open(), h.balance(), h.transaction())
 def test_directives_by_type(op, bal, txn):
@@ -101,21 +133,7 @@ def test_directives_by_type(op, bal, txn):
     )
 
 
-@given(
-    s.dictionaries(
-        s.text(),
-        s.one_of(
-            [
-                s.booleans(),
-                s.text(),
-                s.integers(),
-                s.decimals(allow_nan=False),
-                s.sampled_from(data.Booking),
-                s.lists(s.text()),
-            ]
-        ),
-    )
-)
+@given(s.dictionaries(s.text(), _OPTION_VALUES))
 def test_options(ctx: Ctx, o: Dict[str, types.OptionValues]):
     po = file.Options.parse(o)
     ctx.compare_dict(o, po.__dict__)
@@ -123,19 +141,7 @@ def test_options(ctx: Ctx, o: Dict[str, types.OptionValues]):
 
 @given(
     h.transaction(),
-    s.dictionaries(
-        s.text(),
-        s.one_of(
-            [
-                s.booleans(),
-                s.text(),
-                s.integers(),
-                s.decimals(allow_nan=False),
-                s.sampled_from(data.Booking),
-                s.lists(s.text()),
-            ]
-        ),
-    ),
+    s.dictionaries(s.text(), _OPTION_VALUES),
 )
 def test_file_compress(txn, opts):
     bf = file.BeancountFile.parse(([txn], [], opts))
@@ -3,6 +3,7 @@ from decimal import Decimal
 from typing import Any
 from unittest.mock import Mock, patch
 
+import pytest
 from beancount.core import amount, data
 from conftest import Ctx
 
@@ -16,139 +17,140 @@ from bdantic import (
     types,
 )
 
+_NUMBER = Decimal("1.50")
+_TODAY = date.today()
 
-def test_parse():
-    txn = data.Transaction(
-        meta=None,
-        date=date.today(),
-        flag="*",
-        payee="test",
-        narration="test",
-        tags=None,
-        links=None,
-        postings=[
-            data.Posting(
-                account="Test",
-                units=amount.Amount(number=Decimal(1.50), currency="USD"),
-                cost=None,
-                price=None,
-                flag=None,
-                meta={},
-            )
-        ],
-    )
-
-    expected = models.directives.Transaction(
-        date=date.today(),
-        flag="*",
-        payee="test",
-        narration="test",
-        tags=None,
-        links=None,
-        postings=[
-            models.directives.Posting(
-                account="Test",
-                units=models.data.Amount(number=Decimal(1.50), currency="USD"),
-                cost=None,
-                price=None,
-                flag=None,
-                meta={},
-            )
-        ],
-    )
-
-    result = parse(txn)
-    assert result == expected
-
-
-def test_parse_all():
-    btypes = []
-    expected_models = []
-
-    btypes.append(amount.Amount(number=Decimal(1.50), currency="USD"))
-    btypes.append(
+# Pairs of beancount types and the models they are expected to parse into
+_PARSE_CASES = [
+    (
+        amount.Amount(number=_NUMBER, currency="USD"),
+        models.data.Amount.construct(number=_NUMBER, currency="USD"),
+    ),
+    (
         data.Balance(
-            meta=None,
-            date=date.today(),
+            meta=None,  # type: ignore
+            date=_TODAY,
             account="Test",
-            amount=amount.Amount(number=Decimal(1.50), currency="USD"),
+            amount=amount.Amount(number=_NUMBER, currency="USD"),
             tolerance=None,
             diff_amount=None,
-        )
-    )
-
-    expected_models.append(
-        models.data.Amount(number=Decimal(1.50), currency="USD")
-    )
-    expected_models.append(
-        models.directives.Balance(
-            meta=None,
-            date=date.today(),
+        ),
+        models.directives.Balance.construct(
+            date=_TODAY,
             account="Test",
-            amount=models.data.Amount(number=Decimal(1.50), currency="USD"),
-            tolerance=None,
-            diff_amount=None,
-        )
-    )
+            amount=models.data.Amount.construct(
+                number=_NUMBER, currency="USD"
+            ),
+        ),
+    ),
+    (
+        data.Transaction(
+            meta=None,  # type: ignore
+            date=_TODAY,
+            flag="*",
+            payee="test",
+            narration="test",
+            tags=None,
+            links=None,
+            postings=[
+                data.Posting(
+                    account="Test",
+                    units=amount.Amount(number=_NUMBER, currency="USD"),
+                    cost=None,
+                    price=None,
+                    flag=None,
+                    meta={},
+                )
+            ],
+        ),
+        models.directives.Transaction.construct(
+            date=_TODAY,
+            flag="*",
+            payee="test",
+            narration="test",
+            tags=None,
+            links=None,
+            postings=[
+                models.directives.Posting.construct(
+                    account="Test",
+                    units=models.data.Amount.construct(
+                        number=_NUMBER, currency="USD"
+                    ),
+                    cost=None,
+                    price=None,
+                    flag=None,
+                    meta={},
+                )
+            ],
+        ),
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "btype, expected",
+    _PARSE_CASES,
+    ids=[type(btype).__name__ for btype, _ in _PARSE_CASES],
+)
+def test_parse(btype: types.BeancountType, expected: types.Model):
+    result = parse(btype)
+    assert result == expected
+
+
+def test_parse_all():
+    btypes = [btype for btype, _ in _PARSE_CASES]
+    expected_models = [expected for _, expected in _PARSE_CASES]
 
     result = parse_all(btypes)
     assert result == expected_models
 
 
 def test_parse_directives():
-    btypes = []
-    expected_models = []
-
-    btypes.append(
+    btypes = [
         data.Balance(
             meta=None,
-            date=date.today(),
+            date=_TODAY,
             account="Test",
-            amount=amount.Amount(number=Decimal(1.50), currency="USD"),
+            amount=amount.Amount(number=_NUMBER, currency="USD"),
             tolerance=None,
             diff_amount=None,
-        )
-    )
-    btypes.append(
+        ),
         data.Open(
             meta=None,
-            date=date.today(),
+            date=_TODAY,
             account="Test",
             currencies=["USD"],
             booking=None,
-        )
-    )
-    btypes.append(
+        ),
         data.Commodity(
             meta=None,
-            date=date.today(),
+            date=_TODAY,
             currency="USD",
-        )
-    )
-
-    expected_models.append(
-        models.directives.Balance(
-            date=date.today(),
+        ),
+    ]
+    expected_models = [
+        models.directives.Balance.construct(
+            date=_TODAY,
             account="Test",
-            amount=models.data.Amount(number=Decimal(1.50), currency="USD"),
+            amount=models.data.Amount.construct(
+                number=_NUMBER, currency="USD"
+            ),
             tolerance=None,
             diff_amount=None,
-        )
-    )
-    expected_models.append(
-        models.directives.Open(
-            date=date.today(),
+        ),
+        models.directives.Open.construct(
+            date=_TODAY,
             account="Test",
             currencies=["USD"],
-        )
-    )
-    expected_models.append(
-        models.directives.Commodity(
-            date=date.today(),
+        ),
+        models.directives.Commodity.construct(
+            date=_TODAY,
             currency="USD",
-        )
+        ),
+    ]
+    expected_directives = models.file.Directives.construct(
+        __root__=expected_models
     )
-    expected_directives = models.file.Directives(__root__=expected_models)
 
     result = parse_directives(btypes)
     assert result == expected_directives
@@ -158,22 +160,10 @@ def test_parse_loader(
     ctx: Ctx, beanfile: tuple[list[data.Directive], list, dict[str, Any]]
 ):
     entries, errors, options = beanfile
-    # import pprint
-
-    # pprint.pprint(options)
     parsed = parse_loader(entries, errors, options)
-    # print(parsed.options.export())
-
-    def compare(object1, object2):
-        for expected, result in zip(object1, object2):
-            if type(expected) in types.type_map.keys():
-                ctx.compare_object(expected, result)
-            else:
-                if expected and result:
-                    assert expected == result
 
     # Entries
-    compare(entries, parsed.entries.export())
+    assert parsed.entries.export() == entries
 
     # Options
     expected = options
@@ -192,6 +182,28 @@ def test_parse_loader(
     assert len(ids) == len(set(ids))
 
 
+def test_parse_trusted(
+    ctx: Ctx, beanfile: tuple[list[data.Directive], list, dict[str, Any]]
+):
+    entries, _, _ = beanfile
+    expected = parse_directives(entries)
+    result = parse_directives(entries, trusted=True)
+
+    assert result == expected
+    for entry, model in zip(entries, result):
+        ctx.compare_object(model, entry)
+        assert model == parse(entry, trusted=True)
+
+    # Currencies are interned, so every posting shares one copy of each
+    for directives in (expected, result):
+        currencies = [
+            p.units.currency
+            for d in directives.by_type(models.Transaction)
+            for p in d.postings
+        ]
+        assert len({id(c) for c in currencies}) == len(set(currencies))
+
+
 @patch("bdantic.models.QueryResult.parse")
 def test_parse_query(p):
     m = Mock()
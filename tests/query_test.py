@@ -46,12 +46,7 @@ def query_response(draw):
     )
 
     # The row columns must match the header columns
-    rows = []
-    for d in data:
-        row = {}
-        for i in range(len(column_names)):
-            row[column_names[i]] = d[i]
-        rows.append(row)
+    rows = [dict(zip(column_names, d)) for d in data]
 
     return (columns, rows)
 
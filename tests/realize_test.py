@@ -1,6 +1,7 @@
 from typing import Any
 
 import beancount_hypothesis as h
+import pytest
 from beancount.core import data, realization
 from conftest import Ctx
 from hypothesis import given
@@ -22,15 +23,21 @@ def test_account(ctx: Ctx, txns, acct, inv, open):
 
     a = realize.Account.parse(ra)
 
-    balance = {}
-    for k, v in ra.balance.split().items():
-        balance[k] = v.get_positions()
+    balance = {k: v.get_positions() for k, v in ra.balance.split().items()}
     ctx.compare_dict(a.balance, balance)
     assert a.close is None
     assert a.name == ra.account
     assert a.open == open.date
 
 
+@given(h.account_name())
+def test_account_no_open(acct):
+    ra = realization.RealAccount(acct)
+
+    with pytest.raises(ValueError):
+        realize.Account.parse(ra)
+
+
 @given(h.transactions())
 def test_realaccount(txns):
     ra = realization.realize(txns)
@@ -47,3 +54,32 @@ def test_realize(beanfile: tuple[list[data.Directive], list, dict[str, Any]]):
     era = pra.export()
 
     assert era == ra
+
+
+def test_to_account(
+    beanfile: tuple[list[data.Directive], list, dict[str, Any]],
+):
+    entries, _, _ = beanfile
+    ra = realization.realize(entries)
+    pra = realize.RealAccount.parse(ra)
+
+    for entry in entries:
+        if isinstance(entry, data.Open):
+            expected = realize.Account.parse(
+                realization.get(ra, entry.account)
+            )
+            result = pra.get(entry.account)
+
+            assert result is not None
+            assert result.to_account() == expected
+
+            # The result is cached until a field is reassigned
+            account = result.to_account()
+            assert result.to_account() is account
+            result.account = result.account
+            assert result.to_account() is not account
+
+            # Copies never share the cache of the original
+            copied = result.copy(update={"account": "Assets:Copied"})
+            assert copied.to_account().name == "Assets:Copied"
+            assert result.to_account().name == entry.account